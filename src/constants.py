@@ -1,6 +1,12 @@
+from __future__ import annotations
 from dotenv import load_dotenv
-from github import Github, Repository
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 import os
+import requests
+
+if TYPE_CHECKING:
+    from github import Github, Repository
 
 # Load environment variables from a .env file
 load_dotenv()
@@ -8,6 +14,11 @@ load_dotenv()
 GH_TOKEN = os.getenv("GH_TOKEN")
 
 REPO_NAME = "ViTeXFTW/Changelog-Generator"
+GRAPHQL_URL = "https://api.github.com/graphql"
+# Page size for paginated API results, the maximum GitHub allows
+PER_PAGE = 100
+# Seconds to wait for the GitHub API before giving up on a request, the same as PyGithub's default
+REQUEST_TIMEOUT = 15
 RELEASE_BRANCH = "main"
 CI_AUTHOR = {
     "name": "GitHub Actions",
@@ -16,7 +27,24 @@ CI_AUTHOR = {
 
 CHANGELOG_INITIAL_CONTENT = "# Changelog\n\nAll notable changes to this project will be documented in this file.\n\nThe format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/), and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).\n\n"
 MAX_COMMIT_HEADER_LENGTH = 100
-SEMANTIC_VERSIONING_TYPES = ["breaking change", "feat", "feature", "fix"]
+# Semantic versioning types and the version bump each of them causes, "feat" also matches "feature"
+SEMANTIC_VERSIONING_TYPES = MappingProxyType({"breaking change": "major", "feat": "minor", "fix": "patch"})
+# Conventional commit types and the version bump each of them causes. Headlines with any other
+# "type:" prefix, e.g. "Bugfix:", are not treated as conventional commits
+CONVENTIONAL_COMMIT_TYPES = MappingProxyType({
+    "feat": "minor",
+    "feature": "minor",
+    "fix": "patch",
+    "docs": None,
+    "chore": None,
+    "refactor": None,
+    "perf": None,
+    "test": None,
+    "build": None,
+    "ci": None,
+    "style": None,
+    "revert": None,
+})
 
 def authenticate() -> tuple[Github, Repository.Repository]:
     """
@@ -25,11 +53,13 @@ def authenticate() -> tuple[Github, Repository.Repository]:
     :return: A tuple containing the GitHub object and the repository object.
     """
     
+    from github import Github, GithubException
+
     global ghub, repository
     try:
-        ghub = Github(GH_TOKEN)
+        ghub = Github(GH_TOKEN, per_page=PER_PAGE)
         repository = ghub.get_repo(REPO_NAME)
         return ghub, repository
-    except:
+    except (GithubException, requests.RequestException):
         print("Authentication failed.")
         return False
\ No newline at end of file
@@ -1,16 +1,123 @@
-from github import PullRequest, Commit, InputGitAuthor
+from __future__ import annotations
 import argparse
+import difflib
 from loguru import logger
+import requests
+import json
+import os
 import sys
 import re
-from datetime import datetime
-from constants import RELEASE_BRANCH, CHANGELOG_INITIAL_CONTENT, MAX_COMMIT_HEADER_LENGTH, SEMANTIC_VERSIONING_TYPES, CI_AUTHOR, authenticate
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import cache
+from itertools import chain
+from typing import TYPE_CHECKING
+from constants import GH_TOKEN, REPO_NAME, GRAPHQL_URL, PER_PAGE, REQUEST_TIMEOUT, RELEASE_BRANCH, CHANGELOG_INITIAL_CONTENT, MAX_COMMIT_HEADER_LENGTH, SEMANTIC_VERSIONING_TYPES, CONVENTIONAL_COMMIT_TYPES, CI_AUTHOR, authenticate
+
+if TYPE_CHECKING:
+    # PyGithub is only imported at runtime where it is needed, which keeps importing this module cheap
+    from github import ContentFile, Github, InputGitAuthor, Repository
 
 # Meta information
 CHANGELOG_FILE = "CHANGELOG.md"
 COMMIT_MESSAGE = "chore(changelog): update changelog and create release [skip ci]"
+CACHE_DIR = ".changelog-cache"
+CHANGELOG_CACHE_FILE = os.path.join(CACHE_DIR, "changelog.json")
+
+# GraphQL queries
+MERGED_PRS_QUERY = """
+query($owner: String!, $name: String!, $ref: String!, $perPage: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: MERGED, baseRefName: $ref, orderBy: {field: UPDATED_AT, direction: DESC}, first: $perPage, after: $cursor) {
+      pageInfo { endCursor hasNextPage }
+      nodes { title body number mergedAt updatedAt mergeCommit { oid } }
+    }
+  }
+}
+"""
+COMMITS_QUERY = """
+query($owner: String!, $name: String!, $ref: String!, $since: GitTimestamp!, $perPage: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    ref(qualifiedName: $ref) {
+      target {
+        ... on Commit {
+          history(since: $since, first: $perPage, after: $cursor) {
+            pageInfo { endCursor hasNextPage }
+            nodes { oid messageHeadline messageBody parents { totalCount } }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Matches a release line, e.g. "## v1.2.3 (YYYY-MM-DD)"
+_RELEASE_LINE_RE = re.compile(r'##\s*(v[\d\.]+)\s*\((\d{4}-\d{2}-\d{2})\)$')
+# Matches a version, e.g. "v1.2.3"
+_VERSION_RE = re.compile(r'v(\d+)\.(\d+)\.(\d+)$')
+# Matches the first release header line, without splitting the changelog into lines
+_RELEASE_HEADER_RE = re.compile(rb'^##[^\r\n]*', re.M)
+# Matches the date of an initial release header, e.g. "## [Initial Release] - 2025-03-16"
+_INITIAL_RELEASE_RE = re.compile(r'initial release\W*(\d{4}-\d{2}-\d{2})', re.I)
+# Version bumps from highest to lowest
+BUMP_PRIORITY = ("major", "minor", "patch")
+# Matches any of the semantic versioning types in a single pass, with one capture group
+# per version bump in the same order as _BUMP_GROUPS, so match.lastindex identifies the bump
+_BUMP_GROUPS = tuple(bump for bump in BUMP_PRIORITY if bump in SEMANTIC_VERSIONING_TYPES.values())
+_SEMANTIC_TYPE_RE = re.compile(
+    "|".join(
+        "(" + "|".join(
+            re.escape(type)
+            for type in sorted(SEMANTIC_VERSIONING_TYPES, key=len, reverse=True)
+            if SEMANTIC_VERSIONING_TYPES[type] == bump
+        ) + ")"
+        for bump in _BUMP_GROUPS
+    ),
+    re.I,
+)
+
+# Matches a conventional commit prefix, e.g. "feat(scope)!:"
+_CONVENTIONAL_PREFIX_RE = re.compile(r'\s*(?P<type>\w+)(?:\([^)]*\))?(?P<breaking>!)?\s*:')
+# Matches a conventional commit BREAKING CHANGE footer at the start of a line
+_BREAKING_CHANGE_RE = re.compile(r'^BREAKING[ -]CHANGE:', re.M)
+
+class GraphQLError(Exception):
+    """
+    Raised when the GitHub GraphQL API reports errors or returns an incomplete response.
+    """
 
-ghub, repository = authenticate()
+@dataclass(slots=True)
+class CommitLite:
+    """
+    The parts of a commit needed to build a changelog entry.
+    """
+    sha: str
+    headline: str
+    body: str
+    bump: str
+
+@dataclass(slots=True)
+class PullRequestLite:
+    """
+    The parts of a merged pull request needed to build a changelog entry.
+    """
+    number: int
+    title: str
+    body: str
+    merge_commit_sha: str | None
+    bump: str
+
+@cache
+def _github() -> tuple[Github, Repository.Repository]:
+    """
+    Authenticate with the GitHub API on first use, so that importing this module makes no network calls.
+    
+    :return: The GitHub object and the repository object, or False if authentication failed.
+    """
+    return authenticate()
 
 def parse_release_line(line: str) -> dict:
     """
@@ -19,14 +126,130 @@ def parse_release_line(line: str) -> dict:
     :param line: A line from the changelog file.
     :return: A dictionary with version and release_date, or None if parsing fails.
     """
-    match = re.match(r'##\s*(v[\d\.]+)\s*\((\d{4}-\d{2}-\d{2})\)$', line)
+    match = _RELEASE_LINE_RE.match(line)
     if match:
         version = match.group(1)
         date_str = match.group(2)
-        release_date = datetime.strptime(date_str, '%Y-%m-%d')
+        release_date = datetime.fromisoformat(date_str)
         return {"version": version, "release_date": release_date}
     return None
 
+def format_timestamp(value: datetime) -> str:
+    """
+    Format a naive UTC datetime the way the GitHub API formats timestamps.
+    Timestamps in this format sort chronologically as plain strings, so API
+    results can be compared against it without parsing every one of them.
+    
+    :param value: A naive datetime in UTC.
+    :return: A timestamp in the format YYYY-MM-DDTHH:MM:SSZ.
+    """
+    return value.isoformat(timespec="seconds") + "Z"
+
+def _graphql_query(session: requests.Session, query: str, variables: dict) -> dict:
+    """
+    Run a single query against the GitHub GraphQL API.
+    
+    :param session: The authenticated session to send the query with.
+    :param query: The GraphQL query document.
+    :param variables: The variables referenced by the query.
+    :return: The data member of the response.
+    """
+    response = session.post(
+        GRAPHQL_URL,
+        json={"query": query, "variables": variables},
+        timeout=REQUEST_TIMEOUT,
+    )
+    response.raise_for_status()
+    payload = response.json()
+    if payload.get("errors"):
+        raise GraphQLError(f"GraphQL query failed: {payload['errors']}")
+    if payload.get("data") is None:
+        raise GraphQLError("GraphQL response has no data.")
+    return payload["data"]
+
+def _graphql_nodes(query: str, variables: dict, *path: str) -> Iterator[dict]:
+    """
+    Iterate over the nodes of a paginated GraphQL connection.
+    Pages are only requested once the previous page has been consumed, so
+    callers can stop early by breaking out of the loop.
+    
+    :param query: The GraphQL query document, taking $perPage and $cursor variables.
+    :param variables: The remaining variables referenced by the query.
+    :param path: The keys leading from the response data to the connection.
+    :return: An iterator over the connection nodes.
+    """
+    cursor = None
+    # One session per connection, so every page reuses the same HTTP connection
+    with requests.Session() as session:
+        session.headers["Authorization"] = f"bearer {GH_TOKEN}"
+        while True:
+            connection = _graphql_query(session, query, {**variables, "perPage": PER_PAGE, "cursor": cursor})
+            for key in path:
+                # A missing key means an unexpected shape, e.g. a ref whose target is not a commit
+                connection = connection.get(key)
+                if connection is None:
+                    raise GraphQLError(f"GraphQL response has no {key}.")
+            yield from connection["nodes"]
+            if not connection["pageInfo"]["hasNextPage"]:
+                return
+            cursor = connection["pageInfo"]["endCursor"]
+
+def _load_cache(path: str) -> dict:
+    """
+    Load a JSON cache file written by a previous run.
+    
+    :param path: The path of the cache file.
+    :return: The cached data, or None if there is no usable cache.
+    """
+    try:
+        with open(path, encoding="utf-8") as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+def _save_cache(path: str, data: dict) -> None:
+    """
+    Write a JSON cache file for the next run. Failing to write the cache is not fatal.
+    
+    :param path: The path of the cache file.
+    :param data: The data to cache.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as cache_file:
+            json.dump(data, cache_file)
+    except OSError as e:
+        logger.warning(f"Could not write cache file {path}: {e}")
+
+@cache
+def fetch_changelog() -> ContentFile.ContentFile:
+    """
+    Fetch the changelog file from the release branch, at most once per run.
+    A copy cached by a previous run is revalidated with its ETag, GitHub then answers
+    304 Not Modified without a body if the file did not change and the cached copy is reused.
+    
+    :return: The changelog file.
+    """
+    ghub, repository = _github()
+    cached = _load_cache(CHANGELOG_CACHE_FILE)
+    if not (isinstance(cached, dict) and "etag" in cached and "content" in cached):
+        # An incomplete cache is ignored, the file is then downloaded in full
+        cached = None
+    headers = {"If-None-Match": cached["etag"]} if cached else None
+    response_headers, data = ghub.requester.requestJsonAndCheck(
+        "GET",
+        f"{repository.url}/contents/{CHANGELOG_FILE}",
+        parameters={"ref": RELEASE_BRANCH},
+        headers=headers,
+    )
+    if data is None and cached:
+        logger.debug("Changelog not modified since last run, using cached copy.")
+        data = cached["content"]
+    elif "etag" in response_headers:
+        _save_cache(CHANGELOG_CACHE_FILE, {"etag": response_headers["etag"], "content": data})
+    from github import ContentFile
+    return ContentFile.ContentFile(ghub.requester, response_headers, data, completed=True)
+
 def get_latest_release() -> dict:
     """
     Get the latest version information from the changelog file.
@@ -36,80 +259,183 @@ def get_latest_release() -> dict:
     :return: A dictionary with latest_version and latest_release_date.
     """
     try:
-        current_content = repository.get_contents(CHANGELOG_FILE, ref=RELEASE_BRANCH)
-        decoded = current_content.decoded_content.decode("utf-8")
-        lines = decoded.splitlines()
-        for line in lines:
-            if line.startswith("##"):
-                parsed = parse_release_line(line)
-                if parsed:
-                    logger.debug(f"Found version {parsed['version']} with date {parsed['release_date']} in changelog.")
-                    return {"latest_version": parsed["version"], "latest_release_date": parsed["release_date"]}
-                else:
-                    # Fallback if format doesn't match: use the header as version and minimal date.
-                    version = line.replace("##", "").strip()
-                    logger.warning(f"Found version {version} in changelog without date format.")
-                    return {"latest_version": version, "latest_release_date": datetime.min}
-        logger.warning("No release version found in changelog.")
-        return None
+        current_content = fetch_changelog()
+        # Search the raw bytes, only the header line itself needs to be decoded
+        match = _RELEASE_HEADER_RE.search(current_content.decoded_content)
+        if not match:
+            logger.warning("No release version found in changelog.")
+            return None
+        line = match.group(0).decode("utf-8")
+        parsed = parse_release_line(line)
+        if parsed:
+            logger.debug(f"Found version {parsed['version']} with date {parsed['release_date']} in changelog.")
+            return {"latest_version": parsed["version"], "latest_release_date": parsed["release_date"]}
+        # Fallback if format doesn't match: use the header as version.
+        version = line.replace("##", "").strip()
+        initial_release = _INITIAL_RELEASE_RE.search(line)
+        if initial_release:
+            # Only look at what happened after the initial release instead of the whole history
+            release_date = datetime.fromisoformat(initial_release.group(1))
+            logger.debug(f"Found initial release with date {release_date} in changelog.")
+            return {"latest_version": version, "latest_release_date": release_date}
+        logger.warning(f"Found version {version} in changelog without date format.")
+        return {"latest_version": version, "latest_release_date": datetime.min}
     except Exception as e:
         logger.warning(f"Changelog file not found or unreadable: {e}")
         return None
 
 
-def get_commits_since(release_date: datetime) -> list[Commit.Commit]:
-    commits: list[Commit.Commit] = []
+def classify_bump(headline: str, body: str = "") -> str | None:
+    """
+    Classify the version bump requested by a commit message or PR.
+    A headline with a conventional commit prefix, e.g. "feat(scope)!: ...", whose type is one of the
+    CONVENTIONAL_COMMIT_TYPES is classified by that type, a "!" or a "BREAKING CHANGE:" footer in the body.
+    Other messages are scanned for any of the SEMANTIC_VERSIONING_TYPES.
+    
+    :param headline: The commit headline or PR title.
+    :param body: The commit body or PR description.
+    :return: The highest of "major", "minor" or "patch" requested by the message, or None.
+    """
+    bump, conventional = _classify_headline(headline)
+    return _add_body_bump(bump, body, conventional)
+
+def _classify_headline(headline: str) -> tuple[str | None, bool]:
+    """
+    Classify the version bump requested by a commit headline or PR title alone.
+    
+    :param headline: The commit headline or PR title.
+    :return: The bump requested by the headline, or None, and whether the headline is a conventional commit.
+    """
+    prefix = _CONVENTIONAL_PREFIX_RE.match(headline)
+    commit_type = prefix.group("type").lower() if prefix else None
+    if commit_type not in CONVENTIONAL_COMMIT_TYPES:
+        return _scan_bump(headline), False
+    if prefix.group("breaking"):
+        return "major", True
+    return CONVENTIONAL_COMMIT_TYPES[commit_type], True
+
+def _add_body_bump(bump: str | None, body: str, conventional: bool) -> str | None:
+    """
+    Raise the bump of a headline to the one requested by its body, if that is higher.
+    The body of a conventional commit only counts through a "BREAKING CHANGE:" footer.
+    
+    :param bump: The bump requested by the headline, or None.
+    :param body: The commit body or PR description.
+    :param conventional: Whether the headline is a conventional commit.
+    :return: The highest of the two bumps, or None.
+    """
+    if bump == "major" or not body:
+        return bump
+    if conventional:
+        return "major" if _BREAKING_CHANGE_RE.search(body) else bump
+    body_bump = _scan_bump(body)
+    if bump is None or (body_bump and BUMP_PRIORITY.index(body_bump) < BUMP_PRIORITY.index(bump)):
+        return body_bump
+    return bump
+
+def _scan_bump(text: str) -> str | None:
+    """
+    Find the highest version bump mentioned anywhere in a text.
+    
+    :param text: The text to scan.
+    :return: The highest of "major", "minor" or "patch" mentioned in the text,
+             or None if it contains none of the SEMANTIC_VERSIONING_TYPES.
+    """
+    highest = None
+    for match in _SEMANTIC_TYPE_RE.finditer(text):
+        if highest is None or match.lastindex < highest:
+            highest = match.lastindex
+            if highest == 1:
+                # Nothing ranks above the first group
+                break
+    return _BUMP_GROUPS[highest - 1] if highest else None
+
+def get_commits_since(release_date: datetime) -> list[CommitLite]:
+    commits: list[CommitLite] = []
+    owner, name = REPO_NAME.split("/")
+    variables = {
+        "owner": owner,
+        "name": name,
+        "ref": RELEASE_BRANCH,
+        "since": format_timestamp(release_date),
+    }
     try:
-        for commit in repository.get_commits(since=release_date, sha=RELEASE_BRANCH):
-            
-            if any(type in commit.commit.message.lower() for type in SEMANTIC_VERSIONING_TYPES):
-                logger.debug(f"Commit: {commit.commit.message[:MAX_COMMIT_HEADER_LENGTH]}")
-                commits.append(commit)
+        for node in _graphql_nodes(COMMITS_QUERY, variables, "repository", "ref", "target", "history"):
+            # Merge commits only repeat the changes of the commits they merge
+            if node["parents"]["totalCount"] > 1:
+                continue
+            headline, body = node["messageHeadline"], node["messageBody"]
+            # Classify once while decoding, so the version bump does not need to rescan the message
+            bump = classify_bump(headline, body)
+            if bump:
+                logger.opt(lazy=True).debug("Commit: {}", lambda: headline[:MAX_COMMIT_HEADER_LENGTH])
+                commits.append(CommitLite(node["oid"], headline, body, bump))
         logger.info(f"Found {len(commits)} commits since last release.")
-    except:
-        logger.warning("Failed to retrieve commits.")
+    except (requests.RequestException, GraphQLError) as e:
+        logger.warning(f"Failed to retrieve commits: {e}")
     return commits
 
-def get_merged_prs(release_date: datetime) -> list[PullRequest.PullRequest]:
-    merged_prs: list[PullRequest.PullRequest] = []
-    pulls = repository.get_pulls(state="closed", base=RELEASE_BRANCH)
-    for pr in pulls:
-        if pr.merged_at and pr.merged_at > release_date:
-            # PaginatedList of pull request
-            logger.info(f"PR: {pr.title[:MAX_COMMIT_HEADER_LENGTH]}")
-            merged_prs.append(pr)
-    
-    logger.info(f"Found {len(merged_prs)} merged PRs since last release.")
+def get_merged_prs(release_date: datetime) -> list[PullRequestLite]:
+    merged_prs: list[PullRequestLite] = []
+    owner, name = REPO_NAME.split("/")
+    variables = {"owner": owner, "name": name, "ref": RELEASE_BRANCH}
+    since = format_timestamp(release_date)
+    try:
+        # PRs are ordered by last update, so everything after the first stale PR is stale too
+        for pr in _graphql_nodes(MERGED_PRS_QUERY, variables, "repository", "pullRequests"):
+            if pr["updatedAt"] < since:
+                break
+            if pr["mergedAt"] <= since:
+                continue
+            # Only PRs whose title requests a bump are listed, the body can only raise that bump
+            title_bump, conventional = _classify_headline(pr["title"])
+            if title_bump:
+                logger.opt(lazy=True).debug("PR: {}", lambda: pr["title"][:MAX_COMMIT_HEADER_LENGTH])
+                body = pr["body"] or ""
+                merge_commit_sha = pr["mergeCommit"]["oid"] if pr["mergeCommit"] else None
+                bump = _add_body_bump(title_bump, body, conventional)
+                merged_prs.append(PullRequestLite(pr["number"], pr["title"], body, merge_commit_sha, bump))
+        logger.info(f"Found {len(merged_prs)} merged PRs since last release.")
+    except (requests.RequestException, GraphQLError) as e:
+        logger.warning(f"Failed to retrieve merged PRs: {e}")
     return merged_prs
 
-def calculate_new_version(current_version: str, items: list) -> str:
+def drop_listed_prs(merged_prs: Iterable[PullRequestLite], commits: Iterable[CommitLite]) -> list[PullRequestLite]:
+    """
+    Leave out the PRs whose merge commit is already listed, e.g. squash merged PRs,
+    so each change only appears once in the changelog entry.
+    
+    :param merged_prs: The PRs merged since the last release.
+    :param commits: The commits since the last release.
+    :return: The PRs whose merge commit is not among the commits.
+    """
+    commit_shas = {commit.sha for commit in commits}
+    return [pr for pr in merged_prs if pr.merge_commit_sha not in commit_shas]
+
+def calculate_new_version(current_version: str, items: Iterable[PullRequestLite | CommitLite]) -> str:
     major_bump = False
     minor_bump = False
     patch_bump = False
 
     for item in items:
-        if isinstance(item, PullRequest.PullRequest):
-            content = (item.title + "\n" + (item.body or "")).lower()
-        elif isinstance(item, Commit.Commit):
-            content = item.commit.message.lower()
-        else:
-            continue
-
-        if "breaking change" in content:
+        # Items are classified once when they are fetched
+        if item.bump == "major":
+            # A breaking change already decides the bump
             major_bump = True
-        elif "feat" in content or "feature" in content:
+            break
+        elif item.bump == "minor":
             minor_bump = True
-        elif "fix" in content:
+        elif item.bump == "patch":
             patch_bump = True
             
-    try:
-        if current_version.startswith("v"):
-            major_num, minor_num, patch_num = map(int, current_version.strip("v").split("."))
-        else:
-            major_num, minor_num, patch_num = 0, 0, 0
-    except:
+    version = _VERSION_RE.match(current_version)
+    if version:
+        major_num, minor_num, patch_num = int(version[1]), int(version[2]), int(version[3])
+    elif current_version.startswith("v"):
         logger.warning("Invalid version format.")
         return None
+    else:
+        major_num, minor_num, patch_num = 0, 0, 0
     
     if major_bump:
         return f"v{major_num + 1}.0.0"
@@ -120,28 +446,77 @@ def calculate_new_version(current_version: str, items: list) -> str:
     else:
         return current_version
     
+def shorten_commit_title(title: str) -> str:
+    """
+    Shorten a commit title to MAX_COMMIT_HEADER_LENGTH characters.
+    
+    :param title: The commit title.
+    :return: The title, truncated with "..." if it is too long.
+    """
+    if len(title) > MAX_COMMIT_HEADER_LENGTH:
+        return title[:MAX_COMMIT_HEADER_LENGTH] + "..."
+    return title
+
+def create_changelog_entry(new_version: str, merged_prs: Iterable[PullRequestLite], commits: Iterable[CommitLite]) -> str:
+    """
+    Create the changelog entry for a new release, listing merged PRs first and commits second.
+    
+    :param new_version: The version of the new release.
+    :param merged_prs: The PRs merged since the last release.
+    :param commits: The commits since the last release.
+    :return: The changelog entry.
+    """
+    header = f"## {new_version} ({datetime.now(timezone.utc).strftime('%Y-%m-%d')})\n"
+    pr_lines = (f"- {pr.title} (#{pr.number})\n" for pr in merged_prs)
+    commit_lines = (f"- {shorten_commit_title(commit.headline)} ({commit.sha[:7]})\n" for commit in commits)
+    return header + "".join(chain(pr_lines, commit_lines))
+
+def insert_changelog_entry(changelog: str, new_entry: str) -> str:
+    """
+    Insert a new entry just before the first release entry (the first line starting with "##"),
+    maintaining the header. The changelog is sliced at that offset instead of being split into lines.
+    
+    :param changelog: The current changelog content.
+    :param new_entry: The changelog entry to insert.
+    :return: The updated changelog content.
+    """
+    if changelog.startswith("##"):
+        return new_entry + "\n\n" + changelog
+    insert_index = changelog.find("\n##") + 1
+    if insert_index:
+        return changelog[:insert_index] + new_entry + "\n\n" + changelog[insert_index:]
+    # No release entry yet, append the new entry after the header, followed by a blank line
+    if changelog and not changelog.endswith("\n"):
+        changelog += "\n"
+    return changelog + new_entry + "\n"
+
+def _ci_author() -> InputGitAuthor:
+    """
+    Create the author used for commits made by this script.
+    
+    :return: The CI author.
+    """
+    from github import InputGitAuthor
+    return InputGitAuthor(CI_AUTHOR["name"], CI_AUTHOR["email"])
+
 def update_changelog(new_entry: str, dry_run = False) -> str:
+    from github import GithubException
+    _, repository = _github()
     try:
-        current_content = repository.get_contents(CHANGELOG_FILE, ref=RELEASE_BRANCH)
+        current_content = fetch_changelog()
         decoded = current_content.decoded_content.decode("utf-8")
-        # Split the existing changelog into lines
-        lines = decoded.splitlines()
-        # Find the index of the first release entry (lines starting with "##")
-        insert_index = 0
-        for i, line in enumerate(lines):
-            if line.startswith("##"):
-                insert_index = i
-                break
-        else:
-            insert_index = len(lines)
-        
-        # Insert new_entry just before the first release entry, maintaining header
-        updated_lines = lines[:insert_index] + [new_entry, ""] + lines[insert_index:]
-        updated_content = "\n".join(updated_lines)
+        updated_content = insert_changelog_entry(decoded, new_entry)
         
         if dry_run:
-            logger.info("DRY RUN, FULL CHANGELOG: ")
-            logger.info(updated_content)
+            # Only log what changed instead of the full changelog
+            diff = difflib.unified_diff(
+                decoded.splitlines(keepends=True),
+                updated_content.splitlines(keepends=True),
+                fromfile=CHANGELOG_FILE,
+                tofile=CHANGELOG_FILE,
+            )
+            logger.info("DRY RUN, CHANGELOG DIFF:\n" + "".join(diff))
+            return updated_content
         else:
             repository.update_file(
                 current_content.path,
@@ -149,11 +524,11 @@ def update_changelog(new_entry: str, dry_run = False) -> str:
                 updated_content,
                 current_content.sha,
                 branch=RELEASE_BRANCH,
-                author=InputGitAuthor(CI_AUTHOR["name"], CI_AUTHOR["email"])
+                author=_ci_author()
                 )
             logger.success("Changelog updated successfully.")
             return updated_content
-    except:
+    except (GithubException, requests.RequestException):
         if dry_run:
             logger.info("DRY RUN, COULD NOT UPDATE CHANGELOG.")
             return ""
@@ -166,15 +541,31 @@ def update_changelog(new_entry: str, dry_run = False) -> str:
                                        COMMIT_MESSAGE,
                                        content,
                                        branch=RELEASE_BRANCH,
-                                       author=InputGitAuthor(CI_AUTHOR["name"], CI_AUTHOR["email"])
+                                       author=_ci_author()
                                        )
                 logger.success("Changelog created successfully.")
                 return new_entry
-            except:
+            except (GithubException, requests.RequestException):
                 logger.warning("Failed to create the changelog.")
                 return ""
 
+def str_to_bool(value: str) -> bool:
+    """
+    Convert a command line value to a boolean, for flags that are enabled by default.
+    
+    :param value: The value given on the command line.
+    :return: True for true/1/yes, False for false/0/no (case-insensitive).
+    """
+    lowered = value.lower()
+    if lowered in ("true", "1", "yes"):
+        return True
+    if lowered in ("false", "0", "no"):
+        return False
+    raise argparse.ArgumentTypeError(f"Expected a boolean value, got {value!r}.")
+
 def create_release(new_version: str) -> bool:
+    from github import GithubException
+    _, repository = _github()
     try:
         repository.create_git_release(
             tag=new_version,
@@ -184,7 +575,7 @@ def create_release(new_version: str) -> bool:
         )
         logger.success("Release created successfully.")
         return True
-    except:
+    except (GithubException, requests.RequestException):
         logger.warning("Cannot create the release.")
         return False
 
@@ -198,23 +589,29 @@ if __name__ == "__main__":
     
     parser.add_argument(
         "-p", "--pr",
-        action="store_true",
+        type=str_to_bool,
+        nargs="?",
+        const=True,
         default=True,
-        help="Use merged PRs to generate changelog"
+        help="Use merged PRs to generate changelog (default: true, pass false to disable)"
     )
 
     parser.add_argument(
         "-c", "--commit",
-        action="store_true",
+        type=str_to_bool,
+        nargs="?",
+        const=True,
         default=True,
-        help="Use commits to generate changelog"
+        help="Use commits to generate changelog (default: true, pass false to disable)"
     )
 
     parser.add_argument(
         "-r", "--release",
-        action="store_true",
+        type=str_to_bool,
+        nargs="?",
+        const=True,
         default=True,
-        help="Create a new release"
+        help="Create a new release (default: true, pass false to disable)"
     )
 
     parser.add_argument(
@@ -224,12 +621,30 @@ if __name__ == "__main__":
         help="Run the script without making any changes"
     )
 
+    parser.add_argument(
+        "--show-diff",
+        action="store_true",
+        default=False,
+        help="Show the changes to the changelog during a dry run"
+    )
+
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        default=False,
+        help="Log every PR and commit found, along with other debug information"
+    )
+
     args = parser.parse_args()  
 
+    # Debug messages are only formatted when the sink is going to emit them
+    logger.remove()
+    logger.add(sys.stderr, level="DEBUG" if args.verbose else "INFO")
+
     if args.dry_run:
         logger.info("DRY RUN. GOING IN DRY!")
 
-    if not authenticate():
+    if not _github():
         logger.error("Authentication failed. Exiting...")
         exit(0)
 
@@ -241,44 +656,42 @@ if __name__ == "__main__":
     latest_version = release_info["latest_version"]
     logger.info("Latest version: " + latest_version)
 
-    items: list[PullRequest.PullRequest | Commit.Commit] = []
+    # Both lookups are network bound and independent of each other, so run them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if args.pr:
+            merged_prs_future = executor.submit(get_merged_prs, release_info["latest_release_date"])
+        if args.commit:
+            commits_future = executor.submit(get_commits_since, release_info["latest_release_date"])
+
+    merged_prs: list[PullRequestLite] = []
+    commits: list[CommitLite] = []
     if args.pr:
-        merged_prs = get_merged_prs(release_info["latest_release_date"])
-        items.extend(merged_prs)
+        merged_prs = merged_prs_future.result()
         if not merged_prs:
             logger.info("No merged PRs found.")
 
     if args.commit:
-        commits = get_commits_since(release_info["latest_release_date"])
-        items.extend(commits)
+        commits = commits_future.result()
         if not commits:
             logger.info("No commits found.")
 
-
-    new_version = calculate_new_version(latest_version, items)
+    # The bump is taken from every item, so a PR left out below still counts towards it
+    new_version = calculate_new_version(latest_version, chain(merged_prs, commits))
     if not new_version:
         logger.error("Invalid version format. Exiting...")
         exit(3)
         
     logger.info("New version: " + new_version)
 
-    changelog_entry = f"## {new_version} ({datetime.now().strftime('%Y-%m-%d')})\n"
-    for pr in merged_prs:
-        changelog_entry += f"- {pr.title} (#{pr.number})\n"
-
-    for commit in commits:
-        # Add commit message to changelog, unless it is longer than 100 chars
+    merged_prs = drop_listed_prs(merged_prs, commits)
 
-        commit_title = commit.commit.message.splitlines()[0]
-
-        if len(commit_title) > MAX_COMMIT_HEADER_LENGTH:
-            commit_title = commit_title[:MAX_COMMIT_HEADER_LENGTH] + "..."
-        
-        changelog_entry += f"- {commit_title} ({commit.sha[:7]})\n"
-        
+    changelog_entry = create_changelog_entry(new_version, merged_prs, commits)
     logger.info("Changelog entry generated:\n" + changelog_entry)
 
     if args.dry_run:
+        # Building the updated changelog is skipped unless the diff was asked for
+        if args.show_diff:
+            update_changelog(changelog_entry, dry_run=True)
         logger.success("Dry run completed.")
         exit(0)
 
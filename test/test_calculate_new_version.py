@@ -0,0 +1,35 @@
+import pytest
+from main import CommitLite, calculate_new_version
+
+def commit(bump):
+    return CommitLite("abc1234", "message", "", bump)
+
+def test_calculate_new_version_major():
+    items = [commit("patch"), commit("major"), commit("minor")]
+    assert calculate_new_version("v1.2.3", items) == "v2.0.0"
+
+def test_calculate_new_version_stops_at_major():
+    def items():
+        yield commit("major")
+        raise AssertionError("items after a major bump should not be read")
+    assert calculate_new_version("v1.2.3", items()) == "v2.0.0"
+
+def test_calculate_new_version_minor():
+    assert calculate_new_version("v1.2.3", [commit("patch"), commit("minor")]) == "v1.3.0"
+
+def test_calculate_new_version_patch():
+    assert calculate_new_version("v1.2.3", [commit("patch")]) == "v1.2.4"
+
+def test_calculate_new_version_no_bump():
+    assert calculate_new_version("v1.2.3", [commit(None)]) == "v1.2.3"
+    assert calculate_new_version("v1.2.3", []) == "v1.2.3"
+
+def test_calculate_new_version_multi_digit():
+    assert calculate_new_version("v10.20.30", [commit("minor")]) == "v10.21.0"
+
+def test_calculate_new_version_without_previous_version():
+    assert calculate_new_version("", [commit("minor")]) == "v0.1.0"
+
+@pytest.mark.parametrize("version", ["v1.2", "v1.2.3-rc1", "v1.x.3"])
+def test_calculate_new_version_invalid_version(version):
+    assert calculate_new_version(version, [commit("patch")]) is None
@@ -0,0 +1,48 @@
+import pytest
+from main import classify_bump
+
+@pytest.mark.parametrize("text, expected", [
+    ("feat: add exporter", "minor"),
+    ("feature(cli): add flag", "minor"),
+    ("Fix: handle empty body", "patch"),
+    ("fix(parser)!: drop old syntax", "major"),
+    ("feat!: new config format", "major"),
+    ("chore: bump dependencies", None),
+])
+def test_classify_bump_conventional_type(text, expected):
+    assert classify_bump(text) == expected
+
+def test_classify_bump_conventional_type_is_not_scanned():
+    assert classify_bump("docs: fix typo") is None
+    assert classify_bump("chore(ci): add feature flag") is None
+    assert classify_bump("Test: cover fix for crash") is None
+
+@pytest.mark.parametrize("text, expected", [
+    ("Bugfix: crash", "patch"),
+    ("Hotfix: login", "patch"),
+    ("Fixes: #12", "patch"),
+    ("Feature request: dark mode", "minor"),
+    ("Note: update links", None),
+])
+def test_classify_bump_unknown_type_scans_text(text, expected):
+    assert classify_bump(text) == expected
+
+def test_classify_bump_breaking_change_footer():
+    assert classify_bump("feat: new config", "BREAKING CHANGE: old keys are ignored") == "major"
+    assert classify_bump("docs: explain", "Details\n\nBREAKING-CHANGE: renamed option") == "major"
+
+def test_classify_bump_breaking_change_mention_is_not_a_footer():
+    assert classify_bump("docs: no breaking changes") is None
+    assert classify_bump("fix: crash", "This PR has no breaking changes") == "patch"
+    assert classify_bump("fix: crash", "Adds a feature flag") == "patch"
+
+def test_classify_bump_without_prefix_scans_text():
+    assert classify_bump("Add new feature") == "minor"
+    assert classify_bump("Quick fix for feature flag") == "minor"
+    assert classify_bump("Update README") is None
+
+def test_classify_bump_without_prefix_scans_body():
+    assert classify_bump("Update parser", "Fixes #12") == "patch"
+    assert classify_bump("Fix parser", "Also adds a feature") == "minor"
+    assert classify_bump("Add parser", "Fix #12\n\nbreaking change to the API") == "major"
+    assert classify_bump("Add feature", "Fix #12") == "minor"
@@ -0,0 +1,23 @@
+import pytest
+from main import CommitLite, PullRequestLite, drop_listed_prs
+
+def test_drop_listed_prs_squash_merged():
+    # The PR was squash merged as a commit that is already listed
+    prs = [PullRequestLite(7, "feat: new exporter", "", "abc123", "minor")]
+    commits = [CommitLite("abc123", "feat: new exporter (#7)", "", "minor")]
+    assert drop_listed_prs(prs, commits) == []
+
+def test_drop_listed_prs_keeps_pr_of_listed_branch_commit():
+    # Only a commit from the PR branch is listed, not the commit the PR was merged as
+    prs = [PullRequestLite(7, "feat: new exporter", "", "merge7", "minor")]
+    commits = [CommitLite("abc123", "fix: typo", "", "patch")]
+    assert drop_listed_prs(prs, commits) == prs
+
+def test_drop_listed_prs_without_merge_commit():
+    prs = [PullRequestLite(8, "fix: crash", "", None, "patch")]
+    commits = [CommitLite("abc123", "fix: typo", "", "patch")]
+    assert drop_listed_prs(prs, commits) == prs
+
+def test_drop_listed_prs_without_commits():
+    prs = [PullRequestLite(7, "feat: new exporter", "", "abc123", "minor")]
+    assert drop_listed_prs(prs, []) == prs
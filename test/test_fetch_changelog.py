@@ -0,0 +1,67 @@
+import base64
+import json
+import pytest
+import main
+
+CHANGELOG = "# Changelog\n\n## v1.0.0 (2025-01-01)\n- fix: crash (#6)\n"
+CONTENT = {
+    "type": "file",
+    "encoding": "base64",
+    "path": "CHANGELOG.md",
+    "content": base64.b64encode(CHANGELOG.encode("utf-8")).decode("ascii"),
+}
+
+class FakeRequester:
+    is_not_lazy = True
+
+    def __init__(self, status):
+        self.status = status
+        self.headers = None
+
+    def requestJsonAndCheck(self, verb, url, parameters=None, headers=None):
+        self.headers = headers
+        if self.status == 304:
+            return {}, None
+        return {"etag": '"new"'}, CONTENT
+
+class FakeGithub:
+    def __init__(self, status):
+        self.requester = FakeRequester(status)
+
+class FakeRepository:
+    url = "https://api.github.com/repos/owner/name"
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / "changelog.json"
+    monkeypatch.setattr(main, "CHANGELOG_CACHE_FILE", str(path))
+    main.fetch_changelog.cache_clear()
+    yield path
+    main.fetch_changelog.cache_clear()
+
+def use_github(monkeypatch, status):
+    ghub = FakeGithub(status)
+    monkeypatch.setattr(main, "_github", lambda: (ghub, FakeRepository()))
+    return ghub.requester
+
+def test_fetch_changelog_not_modified_uses_cache(cache_file, monkeypatch):
+    cache_file.write_text(json.dumps({"etag": '"old"', "content": CONTENT}))
+    requester = use_github(monkeypatch, 304)
+    changelog = main.fetch_changelog()
+    assert requester.headers == {"If-None-Match": '"old"'}
+    assert changelog.decoded_content.decode("utf-8") == CHANGELOG
+
+def test_fetch_changelog_without_cache_downloads_and_saves(cache_file, monkeypatch):
+    requester = use_github(monkeypatch, 200)
+    changelog = main.fetch_changelog()
+    assert requester.headers is None
+    assert changelog.decoded_content.decode("utf-8") == CHANGELOG
+    assert json.loads(cache_file.read_text()) == {"etag": '"new"', "content": CONTENT}
+
+@pytest.mark.parametrize("cached", ['{"etag": "\\"old\\""}', '["etag", "content"]', "not json"])
+def test_fetch_changelog_ignores_incomplete_cache(cache_file, monkeypatch, cached):
+    cache_file.write_text(cached)
+    requester = use_github(monkeypatch, 200)
+    changelog = main.fetch_changelog()
+    assert requester.headers is None
+    assert changelog.decoded_content.decode("utf-8") == CHANGELOG
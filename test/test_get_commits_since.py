@@ -0,0 +1,52 @@
+import pytest
+from datetime import datetime
+import main
+from main import CommitLite, get_commits_since
+
+def commit_node(oid, headline, body="", parents=1):
+    return {"oid": oid, "messageHeadline": headline, "messageBody": body, "parents": {"totalCount": parents}}
+
+def history_page(nodes, next_cursor=None):
+    page_info = {"endCursor": next_cursor, "hasNextPage": next_cursor is not None}
+    return {"repository": {"ref": {"target": {"history": {"pageInfo": page_info, "nodes": nodes}}}}}
+
+def use_pages(monkeypatch, pages):
+    requests = []
+    def graphql_query(session, query, variables):
+        requests.append(variables)
+        return pages[len(requests) - 1]
+    monkeypatch.setattr(main, "_graphql_query", graphql_query)
+    return requests
+
+def test_get_commits_since_skips_merge_commits(monkeypatch):
+    use_pages(monkeypatch, [history_page([
+        commit_node("a1", "feat: new exporter"),
+        commit_node("m1", "Merge pull request #3 from owner/fix-foo", parents=2),
+        commit_node("b2", "fix: crash", "Details"),
+    ])])
+    assert get_commits_since(datetime(2025, 1, 1)) == [
+        CommitLite("a1", "feat: new exporter", "", "minor"),
+        CommitLite("b2", "fix: crash", "Details", "patch"),
+    ]
+
+def test_get_commits_since_skips_commits_without_bump(monkeypatch):
+    use_pages(monkeypatch, [history_page([commit_node("a1", "docs: readme"), commit_node("b2", "Update README")])])
+    assert get_commits_since(datetime(2025, 1, 1)) == []
+
+def test_get_commits_since_follows_pages(monkeypatch):
+    requests = use_pages(monkeypatch, [
+        history_page([commit_node("a1", "feat: new exporter")], next_cursor="c1"),
+        history_page([commit_node("b2", "fix: crash")]),
+    ])
+    commits = get_commits_since(datetime(2025, 1, 1, 12, 30))
+    assert [commit.sha for commit in commits] == ["a1", "b2"]
+    assert [request["cursor"] for request in requests] == [None, "c1"]
+    assert requests[0]["since"] == "2025-01-01T12:30:00Z"
+
+def test_get_commits_since_keeps_commits_before_error(monkeypatch):
+    def graphql_query(session, query, variables):
+        if variables["cursor"]:
+            raise main.GraphQLError("GraphQL query failed")
+        return history_page([commit_node("a1", "feat: new exporter")], next_cursor="c1")
+    monkeypatch.setattr(main, "_graphql_query", graphql_query)
+    assert [commit.sha for commit in get_commits_since(datetime(2025, 1, 1))] == ["a1"]
@@ -0,0 +1,33 @@
+import pytest
+from datetime import datetime
+import main
+from main import get_latest_release
+
+class FakeContentFile:
+    def __init__(self, text):
+        self.decoded_content = text.encode("utf-8")
+
+def use_changelog(monkeypatch, text):
+    monkeypatch.setattr(main, "fetch_changelog", lambda: FakeContentFile(text))
+
+def test_get_latest_release_release_line(monkeypatch):
+    use_changelog(monkeypatch, "# Changelog\n\n## v1.2.3 (2025-04-01)\n- fix: crash\n\n## v1.2.2 (2025-03-20)\n")
+    assert get_latest_release() == {"latest_version": "v1.2.3", "latest_release_date": datetime(2025, 4, 1)}
+
+def test_get_latest_release_dated_initial_release(monkeypatch):
+    use_changelog(monkeypatch, "# Changelog\n\n## [Initial Release] - 2025-03-16\n\n- initail commit\n")
+    result = get_latest_release()
+    assert result == {"latest_version": "[Initial Release] - 2025-03-16", "latest_release_date": datetime(2025, 3, 16)}
+
+def test_get_latest_release_undated_initial_release(monkeypatch):
+    use_changelog(monkeypatch, "# Changelog\n\n## Initial Release\n\n### Added\n\n- Initial release\n")
+    result = get_latest_release()
+    assert result == {"latest_version": "Initial Release", "latest_release_date": datetime.min}
+
+def test_get_latest_release_crlf_line_endings(monkeypatch):
+    use_changelog(monkeypatch, "# Changelog\r\n\r\n## [Initial Release] - 2025-03-16\r\n")
+    assert get_latest_release()["latest_release_date"] == datetime(2025, 3, 16)
+
+def test_get_latest_release_without_release(monkeypatch):
+    use_changelog(monkeypatch, "# Changelog\n\nNothing released yet.\n")
+    assert get_latest_release() is None
@@ -0,0 +1,69 @@
+import pytest
+from datetime import datetime
+import main
+from main import PullRequestLite, get_merged_prs
+
+SINCE = datetime(2025, 1, 10)
+
+def pr_node(number, title, merged_at, updated_at, body=None, merge_commit=None):
+    return {
+        "number": number,
+        "title": title,
+        "body": body,
+        "mergedAt": merged_at,
+        "updatedAt": updated_at,
+        "mergeCommit": {"oid": merge_commit} if merge_commit else None,
+    }
+
+def pulls_page(nodes, next_cursor=None):
+    page_info = {"endCursor": next_cursor, "hasNextPage": next_cursor is not None}
+    return {"repository": {"pullRequests": {"pageInfo": page_info, "nodes": nodes}}}
+
+def use_pages(monkeypatch, pages):
+    requests = []
+    def graphql_query(session, query, variables):
+        requests.append(variables)
+        return pages[len(requests) - 1]
+    monkeypatch.setattr(main, "_graphql_query", graphql_query)
+    return requests
+
+def test_get_merged_prs_only_merged_since_release(monkeypatch):
+    use_pages(monkeypatch, [pulls_page([
+        pr_node(9, "feat: new exporter", "2025-01-12T08:00:00Z", "2025-01-12T08:00:00Z", merge_commit="abc123"),
+        # Updated after the release, but merged before it
+        pr_node(8, "fix: crash", "2025-01-05T08:00:00Z", "2025-01-11T08:00:00Z"),
+        pr_node(7, "docs: readme", "2025-01-11T08:00:00Z", "2025-01-11T08:00:00Z"),
+    ])])
+    assert get_merged_prs(SINCE) == [PullRequestLite(9, "feat: new exporter", "", "abc123", "minor")]
+
+def test_get_merged_prs_stops_at_first_stale_pr(monkeypatch):
+    requests = use_pages(monkeypatch, [
+        pulls_page([
+            pr_node(9, "fix: crash", "2025-01-12T08:00:00Z", "2025-01-12T08:00:00Z"),
+            pr_node(8, "feat: old exporter", "2025-01-02T08:00:00Z", "2025-01-02T08:00:00Z"),
+            # Not reached, PRs are ordered by last update
+            pr_node(7, "feat: later", "2025-01-12T08:00:00Z", "2025-01-12T08:00:00Z"),
+        ], next_cursor="c1"),
+    ])
+    assert [pr.number for pr in get_merged_prs(SINCE)] == [9]
+    assert len(requests) == 1
+
+def test_get_merged_prs_body_raises_bump(monkeypatch):
+    use_pages(monkeypatch, [pulls_page([
+        pr_node(9, "feat: new config", "2025-01-12T08:00:00Z", "2025-01-12T08:00:00Z", body="BREAKING CHANGE: old keys are ignored"),
+    ])])
+    assert [pr.bump for pr in get_merged_prs(SINCE)] == ["major"]
+
+def test_get_merged_prs_follows_pages(monkeypatch):
+    requests = use_pages(monkeypatch, [
+        pulls_page([pr_node(9, "fix: crash", "2025-01-12T08:00:00Z", "2025-01-12T08:00:00Z")], next_cursor="c1"),
+        pulls_page([pr_node(8, "feat: exporter", "2025-01-11T08:00:00Z", "2025-01-11T08:00:00Z")]),
+    ])
+    assert [pr.number for pr in get_merged_prs(SINCE)] == [9, 8]
+    assert [request["cursor"] for request in requests] == [None, "c1"]
+
+def test_get_merged_prs_error(monkeypatch):
+    def graphql_query(session, query, variables):
+        raise main.GraphQLError("GraphQL query failed")
+    monkeypatch.setattr(main, "_graphql_query", graphql_query)
+    assert get_merged_prs(SINCE) == []
@@ -0,0 +1,45 @@
+import pytest
+import main
+from main import GraphQLError, _graphql_nodes, _graphql_query
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+class FakeSession:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def post(self, url, json, timeout):
+        return FakeResponse(self.payload)
+
+def test_graphql_query_returns_data():
+    assert _graphql_query(FakeSession({"data": {"viewer": {}}}), "query", {}) == {"viewer": {}}
+
+def test_graphql_query_errors():
+    with pytest.raises(GraphQLError):
+        _graphql_query(FakeSession({"errors": [{"message": "Bad credentials"}]}), "query", {})
+
+def test_graphql_query_without_data():
+    with pytest.raises(GraphQLError):
+        _graphql_query(FakeSession({"message": "Not Found"}), "query", {})
+
+def test_graphql_nodes_missing_key(monkeypatch):
+    # A ref whose target is not a commit has no history
+    data = {"repository": {"ref": {"target": {}}}}
+    monkeypatch.setattr(main, "_graphql_query", lambda session, query, variables: data)
+    with pytest.raises(GraphQLError):
+        list(_graphql_nodes("query", {}, "repository", "ref", "target", "history"))
+
+def test_graphql_nodes_null_key(monkeypatch):
+    # A branch that does not exist has a null ref
+    data = {"repository": {"ref": None}}
+    monkeypatch.setattr(main, "_graphql_query", lambda session, query, variables: data)
+    with pytest.raises(GraphQLError):
+        list(_graphql_nodes("query", {}, "repository", "ref", "target", "history"))
@@ -0,0 +1,30 @@
+import pytest
+from main import insert_changelog_entry
+
+ENTRY = "## v1.1.0 (2025-01-02)\n- feat: new exporter (#7)\n"
+
+def test_insert_changelog_entry_above_previous_release():
+    changelog = "# Changelog\n\nIntro.\n\n## v1.0.0 (2025-01-01)\n- fix: crash (#6)\n"
+    result = insert_changelog_entry(changelog, ENTRY)
+    assert result == "# Changelog\n\nIntro.\n\n" + ENTRY + "\n\n## v1.0.0 (2025-01-01)\n- fix: crash (#6)\n"
+
+def test_insert_changelog_entry_leading_release():
+    changelog = "## v1.0.0 (2025-01-01)\n- fix: crash (#6)\n"
+    result = insert_changelog_entry(changelog, ENTRY)
+    assert result == ENTRY + "\n\n" + changelog
+
+def test_insert_changelog_entry_header_only():
+    result = insert_changelog_entry("# Changelog\n\nIntro.\n", ENTRY)
+    assert result == "# Changelog\n\nIntro.\n" + ENTRY + "\n"
+
+def test_insert_changelog_entry_header_without_trailing_newline():
+    result = insert_changelog_entry("# Changelog", ENTRY)
+    assert result == "# Changelog\n" + ENTRY + "\n"
+
+def test_insert_changelog_entry_empty_changelog():
+    assert insert_changelog_entry("", ENTRY) == ENTRY + "\n"
+
+def test_insert_changelog_entry_ignores_inline_hashes():
+    changelog = "# Changelog\n\nSee ## below.\n"
+    result = insert_changelog_entry(changelog, ENTRY)
+    assert result == changelog + ENTRY + "\n"
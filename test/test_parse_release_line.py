@@ -37,4 +37,10 @@ def test_parse_release_line_wrong_date_format():
     # Date not in YYYY-MM-DD format
     line = "## v3.0.0 (31-12-2021)"
     result = parse_release_line(line)
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+def test_parse_release_line_matches_strptime():
+    line = "## v1.0.0 (2024-02-29)"
+    result = parse_release_line(line)
+    assert result is not None
+    assert result["release_date"] == datetime.strptime("2024-02-29", '%Y-%m-%d')
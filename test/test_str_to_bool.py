@@ -0,0 +1,16 @@
+import argparse
+import pytest
+from main import str_to_bool
+
+@pytest.mark.parametrize("value", ["true", "True", "1", "yes", "YES"])
+def test_str_to_bool_true(value):
+    assert str_to_bool(value) is True
+
+@pytest.mark.parametrize("value", ["false", "False", "0", "no", "NO"])
+def test_str_to_bool_false(value):
+    assert str_to_bool(value) is False
+
+@pytest.mark.parametrize("value", ["", "maybe", "2", "off"])
+def test_str_to_bool_invalid(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        str_to_bool(value)